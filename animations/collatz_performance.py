@@ -1,5 +1,10 @@
+import os
 import time
 import math
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
 import matplotlib.pyplot as plt
 import mplcursors
@@ -13,29 +18,190 @@ def collatz_length_naive(n):
     return cnt
 
 # --- optimized Collatz chain length (with memoization)
-_collatz_cache = {1: 0}
+class CollatzMemo:
+    """
+    Bounded memo of Collatz chain lengths: a dense int32 table for n below
+    `table_size` plus a small LRU spill for the larger trajectory values.
+    Chains are walked iteratively, so long chains cannot hit the recursion limit.
+    """
+    SPILL_ENTRY_BYTES = 100  # rough cost of one dict entry with two ints
+
+    def __init__(self, table_size=1 << 20, spill_size=4096):
+        self.table_size = max(2, table_size)
+        self.spill_size = spill_size
+        self.table = array('i', [-1]) * self.table_size
+        self.table[1] = 0
+        self.spill = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self):
+        return (self.table.itemsize * self.table_size
+                + self.SPILL_ENTRY_BYTES * self.spill_size)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'table_size': self.table_size,
+            'spill_used': len(self.spill),
+            'spill_size': self.spill_size,
+            'nbytes': self.nbytes,
+        }
+
+    def _lookup(self, n):
+        if n < self.table_size:
+            return self.table[n]
+        cnt = self.spill.get(n)
+        if cnt is None:
+            return -1
+        self.spill.move_to_end(n)
+        return cnt
+
+    def _store(self, n, cnt):
+        if n < self.table_size:
+            self.table[n] = cnt
+        elif self.spill_size:
+            self.spill[n] = cnt
+            if len(self.spill) > self.spill_size:
+                self.spill.popitem(last=False)
+
+    def length(self, n):
+        path = []
+        cnt = self._lookup(n)
+        while cnt < 0:
+            self.misses += 1
+            path.append(n)
+            n = n // 2 if n % 2 == 0 else 3 * n + 1
+            cnt = self._lookup(n)
+        self.hits += 1
+        for v in reversed(path):
+            cnt += 1
+            self._store(v, cnt)
+        return cnt
+
+MEMO_TABLE_LIMIT = 1 << 24  # 64 MiB of int32 lengths
+_collatz_cache = CollatzMemo()
+
+def reset_collatz_cache(N=None, spill_size=4096):
+    """Replace the shared memo with an empty one sized for 1..N (capped)."""
+    global _collatz_cache
+    size = MEMO_TABLE_LIMIT if N is None else min(N + 1, MEMO_TABLE_LIMIT)
+    _collatz_cache = CollatzMemo(size, spill_size)
+    return _collatz_cache
+
 def collatz_length_opt(n):
-    if n in _collatz_cache:
-        return _collatz_cache[n]
-    if n % 2 == 0:
-        nxt = n // 2
-    else:
-        nxt = 3 * n + 1
-    cnt = 1 + collatz_length_opt(nxt)
-    _collatz_cache[n] = cnt
-    return cnt
+    return _collatz_cache.length(n)
+
+# --- vectorized Collatz chain lengths for a whole range 1..N
+# largest odd value whose 3n+1 still fits in int64
+_MAX_SAFE_ODD = (np.iinfo(np.int64).max - 1) // 3
+_BLOCK = 1 << 18
+
+def _fill_block(lengths, lo, hi, floor):
+    """
+    Fill lengths[lo:hi] by advancing every value of the block in lock-step
+    until it drops below `floor`, then reading the rest of the chain from
+    the already computed prefix lengths[1:floor].
+    """
+    vals = np.arange(lo, hi, dtype=np.int64)
+    pos = np.arange(hi - lo)
+    steps = np.zeros(hi - lo, dtype=np.int32)
+    out = lengths[lo:hi]
+    while vals.size:
+        done = vals < floor
+        if done.any():
+            out[pos[done]] = steps[done] + lengths[vals[done]]
+            keep = ~done
+            vals, pos, steps = vals[keep], pos[keep], steps[keep]
+            if not vals.size:
+                break
+        odd = (vals & 1).astype(bool)
+        # 3n+1 would wrap around: finish these lanes with Python integers
+        big = odd & (vals > _MAX_SAFE_ODD)
+        if big.any():
+            for p, v, s in zip(pos[big], vals[big], steps[big]):
+                out[p] = s + collatz_length_naive(int(v))
+            keep = ~big
+            vals, pos, steps, odd = vals[keep], pos[keep], steps[keep], odd[keep]
+        # 3n+1 is always even, so take both steps at once for odd lanes
+        vals = np.where(odd, (3 * vals + 1) >> 1, vals >> 1)
+        steps += 1 + odd
+
+def collatz_lengths_vectorized(N):
+    """Chain lengths of 1..N as an int32 array indexed by n (index 0 unused)."""
+    lengths = np.zeros(max(N, 1) + 1, dtype=np.int32)
+    lo = 2
+    while lo <= N:
+        # every value below 2*lo halves into the finished prefix
+        hi = min(N + 1, 2 * lo, lo + _BLOCK)
+        _fill_block(lengths, lo, hi, lo)
+        lo = hi
+    return lengths
+
+# --- multi-core sweep writing into shared memory
+def _sweep_shard(shm_name, size, lo, hi, floor):
+    """Pool worker: fill lengths[lo:hi] of the shared array in place."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        lengths = np.ndarray(size, dtype=np.int32, buffer=shm.buf)
+        for start in range(lo, hi, _BLOCK):
+            _fill_block(lengths, start, min(hi, start + _BLOCK), floor)
+        del lengths
+    finally:
+        shm.close()
+
+def parallel_collatz_lengths(N, workers=None, prefix=None):
+    """
+    Chain lengths of 1..N computed by a process pool. The prefix 1..prefix-1
+    is computed up front; the rest of the range is split into shards whose
+    lanes run until they drop into that prefix. Workers write straight into a
+    shared-memory int32 array, so nothing is pickled back.
+    Returns (argmax, lengths) where lengths is indexed by n.
+    """
+    workers = workers or os.cpu_count() or 1
+    # a serial prefix of ~1/(4*workers) of the range keeps shard chains short
+    floor = min(N + 1, prefix or max(_BLOCK, N // (4 * workers)))
+    base = collatz_lengths_vectorized(floor - 1)
+    if floor > N:
+        return int(base.argmax()), base
+
+    size = N + 1
+    shm = shared_memory.SharedMemory(create=True, size=size * 4)
+    try:
+        lengths = np.ndarray(size, dtype=np.int32, buffer=shm.buf)
+        lengths[:floor] = base[:floor]
+        # a few shards per worker keeps the slow top of the range balanced
+        bounds = np.linspace(floor, size, workers * 4 + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_sweep_shard, shm.name, size, int(lo), int(hi), floor)
+                for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo
+            ]
+            for f in futures:
+                f.result()
+        result = lengths.copy()
+        del lengths
+    finally:
+        shm.close()
+        shm.unlink()
+    return int(result.argmax()), result
 
 class CollatzPerformance:
     """
     Static comparison of naive vs optimized Collatz chain-length runtimes
     for various N, plotted on a log-log chart with hover tooltips.
     """
-    def __init__(self, sizes, ax):
+    def __init__(self, sizes, ax, workers=None):
         self.sizes = sizes
+        self.workers = workers or os.cpu_count() or 1
         self.ax = ax
         self.fig = ax.figure
         self.times_naive = []
         self.times_opt = []
+        self.times_vec = []
+        self.times_par = []
         self._compute_times()
         self._plot()
         self._connect()
@@ -49,20 +215,32 @@ class CollatzPerformance:
             t1 = time.perf_counter()
             # optimized total time
             # reset cache
-            global _collatz_cache
-            _collatz_cache = {1: 0}
+            reset_collatz_cache(N)
             t2 = time.perf_counter()
             for i in range(1, N + 1):
                 collatz_length_opt(i)
             t3 = time.perf_counter()
+            # vectorized range engine
+            t4 = time.perf_counter()
+            collatz_lengths_vectorized(N)
+            t5 = time.perf_counter()
+            # multi-core sharded sweep
+            t6 = time.perf_counter()
+            parallel_collatz_lengths(N, self.workers)
+            t7 = time.perf_counter()
 
             self.times_naive.append(t1 - t0)
             self.times_opt.append(t3 - t2)
+            self.times_vec.append(t5 - t4)
+            self.times_par.append(t7 - t6)
 
     def _plot(self):
         self.ax.clear()
         self.ax.plot(self.sizes, self.times_naive, 'o-', label='Naive (O(n ⋅ chain))')
         self.ax.plot(self.sizes, self.times_opt,   's-', label='Optimized (memoized, ≃ O(log n))')
+        self.ax.plot(self.sizes, self.times_vec,   '^-', label='Vectorized (NumPy range)')
+        self.ax.plot(self.sizes, self.times_par,   'D-',
+                     label=f'Parallel ({self.workers} workers)')
         self.ax.set_xscale('log')
         self.ax.set_yscale('log')
         self.ax.set_title('Collatz Chain-Length Performance (14x Faster)', fontweight='bold')
@@ -75,6 +253,10 @@ class CollatzPerformance:
                                           s=50, marker='o', alpha=0.6)
         self.scat_opt   = self.ax.scatter(self.sizes, self.times_opt,
                                           s=50, marker='s', alpha=0.6)
+        self.scat_vec   = self.ax.scatter(self.sizes, self.times_vec,
+                                          s=50, marker='^', alpha=0.6)
+        self.scat_par   = self.ax.scatter(self.sizes, self.times_par,
+                                          s=50, marker='D', alpha=0.6)
 
     def _connect(self):
         # hover tooltips
@@ -90,6 +272,18 @@ class CollatzPerformance:
                 f"opt:   {sel.target[1]:.3f}s"
             )
         )
+        mplcursors.cursor(self.scat_vec, hover=True).connect(
+            "add", lambda sel: sel.annotation.set_text(
+                f"N ≤ {int(sel.target[0])}\n"
+                f"vec:   {sel.target[1]:.3f}s"
+            )
+        )
+        mplcursors.cursor(self.scat_par, hover=True).connect(
+            "add", lambda sel: sel.annotation.set_text(
+                f"N ≤ {int(sel.target[0])}\n"
+                f"par ×{self.workers}: {sel.target[1]:.3f}s"
+            )
+        )
 
     def update(self):
         # static plot only
@@ -1,4 +1,5 @@
 import math
+import random
 import time
 
 # --- primality tests
@@ -50,6 +51,92 @@ def optimized_lpf(n):
                 return i
     return None
 
+# --- Miller–Rabin + Pollard–Brent rho factorization backend
+_SMALL_PRIMES = [p for p in range(2, 1000) if is_prime_opt(p)]
+# these bases make Miller–Rabin deterministic for every n < 3.3 * 10**24
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_MR_EXTRA_ROUNDS = 16
+
+def is_prime_mr(m):
+    """Deterministic Miller–Rabin below 2**64, probabilistic above."""
+    if m < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if m % p == 0:
+            return m == p
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = list(_MR_BASES)
+    if m >= 1 << 64:
+        bases += [random.randrange(2, m - 1) for _ in range(_MR_EXTRA_ROUNDS)]
+    for a in bases:
+        x = pow(a, d, m)
+        if x == 1 or x == m - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_brent(n):
+    """Return a non-trivial factor of the odd composite n (Brent's rho variant)."""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # the batched gcd overshot: retrace one step at a time
+            while True:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+                if g > 1:
+                    break
+        if g != n:
+            return g
+
+def prime_factors(n):
+    """Prime factors of n with multiplicity, in ascending order."""
+    factors = []
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime_mr(m):
+            factors.append(m)
+        else:
+            d = pollard_brent(m)
+            stack += [d, m // d]
+    return sorted(factors)
+
+def fast_lpf(n):
+    if n <= 1:
+        return None
+    return prime_factors(n)[-1]
+
 # --- dual-algorithm progression (animation)
 class DualPrimeFactorProgression:
     def __init__(self, n, ax):
@@ -149,6 +236,7 @@ class PrimeFactorPerformance:
         self.fig = ax.figure
         self.times_naive = []
         self.times_opt = []
+        self.times_fast = []
         self._compute_times()
         self._plot()
         self._connect()
@@ -157,13 +245,16 @@ class PrimeFactorPerformance:
         for n in self.sizes:
             t0 = time.perf_counter(); naive_lpf(n); t1 = time.perf_counter()
             t2 = time.perf_counter(); optimized_lpf(n); t3 = time.perf_counter()
+            t4 = time.perf_counter(); fast_lpf(n); t5 = time.perf_counter()
             self.times_naive.append(t1 - t0)
             self.times_opt.append(t3 - t2)
+            self.times_fast.append(t5 - t4)
 
     def _plot(self):
         self.ax.clear()
         self.ax.plot(self.sizes, self.times_naive, 'o-', label='Naive (O(n²))')
         self.ax.plot(self.sizes, self.times_opt, 's-', label='Optimized (O(log n))')
+        self.ax.plot(self.sizes, self.times_fast, '^-', label='Miller–Rabin + Pollard rho')
         self.ax.set_xscale('log')
         self.ax.set_yscale('log')
         self.ax.set_title('LPF Runtime Comparison (7300x faster)', fontweight='bold')
@@ -173,6 +264,7 @@ class PrimeFactorPerformance:
 
         self.scat_naive = self.ax.scatter(self.sizes, self.times_naive, s=50, marker='o', alpha=0.6)
         self.scat_opt = self.ax.scatter(self.sizes, self.times_opt, s=50, marker='s', alpha=0.6)
+        self.scat_fast = self.ax.scatter(self.sizes, self.times_fast, s=50, marker='^', alpha=0.6)
 
     def _connect(self):
         def fmt(t):
@@ -192,6 +284,12 @@ class PrimeFactorPerformance:
                 f"opt:   {fmt(sel.target[1])}"
             )
         )
+        mplcursors.cursor(self.scat_fast, hover=True).connect(
+            "add", lambda sel: sel.annotation.set_text(
+                f"n = {int(sel.target[0])}\n"
+                f"rho:   {fmt(sel.target[1])}"
+            )
+        )
 
     def update(self):
         return False
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from animations import collatz_performance as cp
+from animations.collatz_performance import (
+    collatz_length_naive,
+    collatz_lengths_vectorized,
+)
+
+@pytest.mark.parametrize("N", [1, 2, 3, 10, 1000])
+def test_vectorized_matches_naive(N):
+    lengths = collatz_lengths_vectorized(N)
+    assert lengths.dtype == np.int32
+    assert [int(x) for x in lengths[1:]] == [collatz_length_naive(i) for i in range(1, N + 1)]
+
+def test_vectorized_overflow_lanes(monkeypatch):
+    # force the int64 guard to trip so the Python-integer fallback is used
+    monkeypatch.setattr(cp, "_MAX_SAFE_ODD", 50)
+    lengths = collatz_lengths_vectorized(500)
+    assert [int(x) for x in lengths[1:]] == [collatz_length_naive(i) for i in range(1, 501)]
+
+def test_memo_bounded_and_counted():
+    memo = cp.CollatzMemo(table_size=64, spill_size=8)
+    assert [memo.length(i) for i in range(1, 200)] == [collatz_length_naive(i) for i in range(1, 200)]
+    assert len(memo.spill) <= 8
+    assert memo.hits == 199 and memo.misses > 0
+    assert memo.stats()['nbytes'] == memo.nbytes
+
+def test_memo_long_chain_is_iterative():
+    memo = cp.CollatzMemo(table_size=16, spill_size=0)
+    n = 2 ** 5000
+    assert memo.length(n) == 5000
+
+def test_collatz_length_opt_uses_reset_cache():
+    memo = cp.reset_collatz_cache(100)
+    assert cp.collatz_length_opt(27) == 111
+    assert memo.misses > 0 and memo.table_size == 101
+
+@pytest.mark.parametrize("N, prefix", [(5, None), (3000, 40)])
+def test_parallel_matches_vectorized(N, prefix):
+    argmax, lengths = cp.parallel_collatz_lengths(N, workers=2, prefix=prefix)
+    expected = collatz_lengths_vectorized(N)
+    assert np.array_equal(lengths, expected)
+    assert argmax == int(expected.argmax())
@@ -1,12 +1,23 @@
 import pytest
 
-from animations.prime_factor import naive_lpf, optimized_lpf, is_prime_naive, is_prime_opt
+from animations.prime_factor import (
+    naive_lpf, optimized_lpf, fast_lpf, is_prime_naive, is_prime_opt, is_prime_mr,
+)
 
 @pytest.mark.parametrize("n", [1, 2, 3, 4, 15, 21, 37, 97, 180])
 def test_lpf_agreement(n):
-    assert naive_lpf(n) == optimized_lpf(n)
+    assert naive_lpf(n) == optimized_lpf(n) == fast_lpf(n)
 
-@pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 5, 18, 37, 97, 100])
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 5, 18, 37, 97, 100, 561, 1105, 7919])
 def test_is_prime_agreement(n):
-    assert is_prime_naive(n) == is_prime_opt(n)
+    assert is_prime_naive(n) == is_prime_opt(n) == is_prime_mr(n)
 
+@pytest.mark.parametrize("n", [600851475143, 10 ** 12 + 39, 2 ** 40 - 87, 1_000_003 * 999_983])
+def test_fast_lpf_matches_optimized(n):
+    assert fast_lpf(n) == optimized_lpf(n)
+
+def test_fast_lpf_large_inputs():
+    p, q = 2 ** 61 - 1, 1_000_000_000_000_000_003
+    assert is_prime_mr(q) and not is_prime_mr(p * q)
+    assert fast_lpf(p * q * 12) == q
+    assert fast_lpf(2 ** 89 - 1) == 2 ** 89 - 1